@@ -0,0 +1,295 @@
+"""
+Local batch JSON API for zone and nearest-warehouse lookups.
+
+Serves the same logic as the Zone Map and Warehouse Map tools without a
+browser session:
+
+    POST /zones    {"origins": ["070", "900"], "destinations": ["10001", "606"]}
+    POST /nearest  {"zips": ["10001", "60601"], "k": 2}
+    GET  /health
+
+Concurrent requests are coalesced into one vectorized lookup against
+tables shared by the whole process, and results are streamed back in
+chunks so large batches never have to be rendered in one piece.
+
+Usage:
+    python api.py --host 127.0.0.1 --port 8080
+"""
+import argparse
+import asyncio
+import json
+from collections import defaultdict
+
+import numpy as np
+from aiohttp import web
+
+from features.tables import NO_ZONE, LookupTables, to_zip3
+
+MAX_BATCH = 100_000
+STREAM_CHUNK = 2_000
+
+
+# ---------------- Request coalescing ----------------
+class MicroBatcher:
+    """
+    Collects payloads submitted within `max_delay` seconds and resolves
+    them with a single call to `handler(payloads) -> results`, run off the
+    event loop so large lookups never stall other connections.
+    """
+
+    def __init__(self, handler, max_delay=0.002):
+        self.handler = handler
+        self.max_delay = max_delay
+        self._pending = []
+        self._flush_task = None
+
+    async def submit(self, payload):
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((payload, future))
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+        return await future
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.max_delay)
+
+        batch, self._pending = self._pending, []
+        self._flush_task = None
+
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(
+            None, self._run_isolated, [payload for payload, _ in batch]
+        )
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _run_isolated(self, payloads):
+        try:
+            return self.handler(payloads)
+        except Exception as e:
+            if len(payloads) == 1:
+                return [e]
+
+        # One bad payload must not fail the requests coalesced with it
+        results = []
+        for payload in payloads:
+            try:
+                results.extend(self.handler([payload]))
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+TABLES_KEY = web.AppKey("tables", LookupTables)
+ZONES_BATCHER_KEY = web.AppKey("zones_batcher", MicroBatcher)
+NEAREST_BATCHER_KEY = web.AppKey("nearest_batcher", MicroBatcher)
+
+
+def split_rows(arrays, sizes):
+    offsets = np.cumsum(sizes)[:-1]
+    return list(zip(*(np.split(a, offsets) for a in arrays)))
+
+
+def zones_handler(tables):
+    def run(payloads):
+        # Requests can only share a lookup when they share origins
+        groups = defaultdict(list)
+        for i, (origins, destinations) in enumerate(payloads):
+            groups[origins].append(i)
+
+        results = [None] * len(payloads)
+        for origins, members in groups.items():
+            sizes = [len(payloads[i][1]) for i in members]
+            destinations = [d for i in members for d in payloads[i][1]]
+
+            zones, from_origin = tables.zones(origins, destinations)
+            parts = split_rows([zones, from_origin.T], sizes)
+            for i, part in zip(members, parts):
+                results[i] = part
+
+        return results
+
+    return run
+
+
+def nearest_handler(tables):
+    def run(payloads):
+        sizes = [len(zips) for zips, _ in payloads]
+        k_max = max(k for _, k in payloads)
+        zips = [z for batch, _ in payloads for z in batch]
+
+        found, names, miles = tables.nearest(zips, k_max)
+        parts = split_rows([found, names, miles], sizes)
+
+        return [
+            (f, n[:, :k], m[:, :k])
+            for (f, n, m), (_, k) in zip(parts, payloads)
+        ]
+
+    return run
+
+
+# ---------------- Response streaming ----------------
+async def stream_results(request, rows):
+    response = web.StreamResponse(
+        headers={"Content-Type": "application/json"}
+    )
+    response.enable_chunked_encoding()
+    await response.prepare(request)
+
+    await response.write(b'{"results": [')
+
+    chunk = []
+    separator = ""
+    for row in rows:
+        chunk.append(json.dumps(row))
+        if len(chunk) >= STREAM_CHUNK:
+            await response.write((separator + ",".join(chunk)).encode())
+            chunk, separator = [], ","
+
+    if chunk:
+        await response.write((separator + ",".join(chunk)).encode())
+
+    await response.write(b"]}")
+    await response.write_eof()
+    return response
+
+
+# ---------------- Request parsing ----------------
+def bad_request(message):
+    return web.HTTPBadRequest(
+        text=json.dumps({"error": message}),
+        content_type="application/json"
+    )
+
+
+async def read_json(request):
+    try:
+        body = await request.json()
+    except ValueError:
+        raise bad_request("Request body must be JSON.")
+    if not isinstance(body, dict):
+        raise bad_request("Request body must be a JSON object.")
+    return body
+
+
+def zip_list(body, field):
+    values = body.get(field)
+    if not isinstance(values, list) or not values:
+        raise bad_request(f"'{field}' must be a non-empty list of ZIP codes.")
+    if len(values) > MAX_BATCH:
+        raise bad_request(f"'{field}' is limited to {MAX_BATCH} entries.")
+
+    values = [str(v).strip() for v in values]
+    # isdigit() alone admits non-ASCII digits such as "²" that int() rejects
+    invalid = [
+        v for v in values
+        if not (v.isascii() and v.isdigit()) or len(v) > 5
+    ]
+    if invalid:
+        raise bad_request(f"Invalid ZIP codes in '{field}': {invalid[:5]}")
+    return values
+
+
+# ---------------- Handlers ----------------
+async def zones_view(request):
+    body = await read_json(request)
+
+    origins = tuple(sorted({o.zfill(3) for o in zip_list(body, "origins")}))
+    if any(len(o) != 3 for o in origins):
+        raise bad_request("'origins' must be 3-digit ZIP prefixes.")
+
+    destinations = zip_list(body, "destinations")
+    dest_zip3 = [to_zip3(d) for d in destinations]
+
+    zones, from_origin = await request.app[ZONES_BATCHER_KEY].submit(
+        (origins, dest_zip3)
+    )
+
+    def rows():
+        for dest, zip3, zone, mask in zip(
+            destinations, dest_zip3, zones.tolist(), from_origin
+        ):
+            yield {
+                "destination": dest,
+                "zip3": zip3,
+                "zone": None if zone == NO_ZONE else zone,
+                "origins": [o for o, hit in zip(origins, mask) if hit],
+            }
+
+    return await stream_results(request, rows())
+
+
+async def nearest_view(request):
+    body = await read_json(request)
+
+    zips = [z.zfill(5) for z in zip_list(body, "zips")]
+    k = body.get("k", 2)
+    if not isinstance(k, int) or k < 1:
+        raise bad_request("'k' must be a positive integer.")
+
+    found, names, miles = await request.app[NEAREST_BATCHER_KEY].submit(
+        (zips, k)
+    )
+
+    def rows():
+        for zip_code, ok, row_names, row_miles in zip(
+            zips, found.tolist(), names.tolist(), miles.round(1).tolist()
+        ):
+            yield {
+                "zip": zip_code,
+                "warehouses": [
+                    {"warehouse": n, "distance_miles": m}
+                    for n, m in zip(row_names, row_miles)
+                ] if ok else None,
+            }
+
+    return await stream_results(request, rows())
+
+
+async def health_view(request):
+    tables = request.app[TABLES_KEY]
+    return web.json_response({
+        "status": "ok",
+        "zips": len(tables.zip_index),
+        "warehouses": len(tables.warehouse_names),
+    })
+
+
+# ---------------- App factory ----------------
+def create_app(tables=None):
+    tables = tables or LookupTables.load()
+
+    app = web.Application(client_max_size=16 * 1024 ** 2)
+    app[TABLES_KEY] = tables
+    app[ZONES_BATCHER_KEY] = MicroBatcher(zones_handler(tables))
+    app[NEAREST_BATCHER_KEY] = MicroBatcher(nearest_handler(tables))
+
+    app.router.add_post("/zones", zones_view)
+    app.router.add_post("/nearest", nearest_view)
+    app.router.add_get("/health", health_view)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Local batch zone / nearest-warehouse API"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    print("Loading zone and warehouse tables...", flush=True)
+    web.run_app(create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import streamlit as st
 
 from features.zone_map import zone_map_app
 from features.warehouse_map import warehouse_map_app
+from features.coverage_map import coverage_map_app
 from features.prioritization_board import prioritization_board_app
 from features.daily_meme import daily_meme_app
 
@@ -14,7 +15,7 @@ st.title("📊 Pricing Team Tools for Sales")
 
 menu = st.sidebar.radio(
     "Select a Tool",
-    ["Zone Map", "Warehouse Map", "Prioritization Board", "Daily Meme"]
+    ["Zone Map", "Warehouse Map", "Coverage Map", "Prioritization Board", "Daily Meme"]
 )
 
 if menu == "Zone Map":
@@ -23,6 +24,9 @@ if menu == "Zone Map":
 elif menu == "Warehouse Map":
     warehouse_map_app()
 
+elif menu == "Coverage Map":
+    coverage_map_app()
+
 elif menu == "Prioritization Board":
     prioritization_board_app()
 
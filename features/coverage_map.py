@@ -0,0 +1,245 @@
+import streamlit as st
+import hashlib
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+import matplotlib.patches as mpatches
+from matplotlib.figure import Figure
+import os
+
+from features.nearest import CoverageIndex, haversine_miles_matrix
+from features.warehouse_map import load_lookup_tables, load_zip_labels
+
+# ---------------- Resource path (repo-root safe) ----------------
+def resource_path(relative_path: str) -> str:
+    return os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        relative_path
+    )
+
+# Distance bands (upper bound in miles, label, color)
+DISTANCE_BANDS = [
+    (50, "< 50", "#001624"),
+    (100, "50–100", "#004A73"),
+    (200, "100–200", "#0073AB"),
+    (300, "200–300", "#42B0D5"),
+    (500, "300–500", "#A1D8EF"),
+    (float("inf"), "500+", "#F5B5B5"),
+]
+
+HYPOTHETICAL_PREFIX = "What-if: "
+
+# ---------------- Cached shared data ----------------
+@st.cache_resource
+def load_warehouse_distances():
+    # Columns of the shared ZIP x warehouse matrix, one per warehouse
+    tables = load_lookup_tables()
+
+    return {
+        name: tables.distances[:, i]
+        for i, name in enumerate(tables.warehouse_names)
+    }
+
+@st.cache_resource
+def load_state_boundaries():
+    return gpd.read_file(
+        resource_path("shapefiles/states_preprocessed.gpkg"),
+        engine="fiona"
+    )
+
+def band_colors(miles):
+    uppers = np.array([upper for upper, _, _ in DISTANCE_BANDS])
+    colors = np.array([color for _, _, color in DISTANCE_BANDS] + ["#CCCCCC"])
+
+    # Bands are [lower, upper); unassigned ZIPs (inf miles) fall through to gray
+    return colors[np.searchsorted(uppers, miles, side="right")]
+
+def assignment_digest(index):
+    # Equidistant sites are tie-broken by toggle order, so the active set
+    # alone does not pin down which site serves each ZIP
+    digest = hashlib.sha256(index.nearest.tobytes())
+    digest.update("\0".join(index.sites).encode("utf-8"))
+    return digest.hexdigest()
+
+@st.cache_data(max_entries=16)
+def coverage_csv(assignment_key, _nearest_sites, _nearest_miles):
+    # Shared across sessions, keyed by the actual ZIP -> site assignment
+    zips = load_lookup_tables().zip_centroids
+
+    return (
+        zips[["zip", "city", "state", "lat", "long"]]
+        .assign(
+            nearest_site=_nearest_sites,
+            distance_miles=np.round(_nearest_miles, 1)
+        )
+        .to_csv(index=False)
+        .encode("utf-8")
+    )
+
+# ---------------- Streamlit Feature Entry Point ----------------
+def coverage_map_app():
+    st.header("🗺️ Warehouse Coverage Map")
+
+    try:
+        tables = load_lookup_tables()
+        zips = tables.zip_centroids
+        warehouses = tables.warehouses
+        warehouse_columns = load_warehouse_distances()
+    except Exception as e:
+        st.error(f"Failed to load data: {e}")
+        return
+
+    warehouse_names = warehouses["warehouse"].tolist()
+
+    # ---------------- What-if controls ----------------
+    col1, col2 = st.columns(2)
+
+    with col1:
+        active_warehouses = st.multiselect(
+            "Active warehouses",
+            options=warehouse_names,
+            default=warehouse_names
+        )
+
+    with col2:
+        hypothetical_labels = st.multiselect(
+            "Add hypothetical warehouse at ZIP",
+            options=load_zip_labels(),
+            placeholder="Start typing ZIP, city, or state..."
+        )
+
+    hypothetical_sites = {
+        HYPOTHETICAL_PREFIX + label: label.split(" – ")[0]
+        for label in hypothetical_labels
+    }
+    active_sites = active_warehouses + list(hypothetical_sites)
+
+    # ---------------- Incremental nearest assignment ----------------
+    if "coverage_index" not in st.session_state:
+        st.session_state.coverage_index = CoverageIndex(len(zips))
+
+    index = st.session_state.coverage_index
+
+    new_columns = {}
+    for site, zip_code in hypothetical_sites.items():
+        if site in index.sites:
+            continue
+        row = zips.iloc[tables.zip_index.get_loc(zip_code)]
+        new_columns[site] = haversine_miles_matrix(
+            zips["lat"].to_numpy(),
+            zips["long"].to_numpy(),
+            [row["lat"]],
+            [row["long"]]
+        )[:, 0]
+
+    changed = index.sync(
+        active_sites,
+        {**warehouse_columns, **new_columns}
+    )
+
+    if not active_sites:
+        st.warning("Select at least one warehouse to see coverage.")
+        return
+
+    st.caption(
+        f"{len(zips):,} ZIPs covered by {len(active_sites)} sites · "
+        f"{len(changed):,} ZIPs re-assigned by the last change"
+    )
+
+    nearest_sites = index.nearest_site_names()
+    nearest_miles = index.nearest_miles
+
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Average distance", f"{nearest_miles.mean():.0f} mi")
+    m2.metric("ZIPs within 200 mi", f"{(nearest_miles < 200).mean():.0%}")
+    m3.metric("Farthest ZIP", f"{nearest_miles.max():.0f} mi")
+
+    # ---------------- Plot ----------------
+    fig = Figure(figsize=(15, 10))
+    ax = fig.subplots()
+
+    load_state_boundaries().boundary.plot(
+        ax=ax, linewidth=0.5, edgecolor="black"
+    )
+
+    ax.scatter(
+        zips["long"],
+        zips["lat"],
+        c=band_colors(nearest_miles),
+        s=2,
+        linewidths=0
+    )
+
+    active_wh = warehouses[warehouses["warehouse"].isin(active_warehouses)]
+    removed_wh = warehouses[~warehouses["warehouse"].isin(active_warehouses)]
+
+    ax.scatter(
+        active_wh["long"], active_wh["lat"],
+        color="red", s=80, edgecolors="white", zorder=3
+    )
+    ax.scatter(
+        removed_wh["long"], removed_wh["lat"],
+        color="gray", s=60, marker="x", zorder=3
+    )
+
+    if hypothetical_sites:
+        hypo = zips[zips["zip"].isin(hypothetical_sites.values())]
+        ax.scatter(
+            hypo["long"], hypo["lat"],
+            color="orange", s=200, marker="*", edgecolors="black", zorder=3
+        )
+
+    # Continental US view
+    ax.set_xlim(-130, -65)
+    ax.set_ylim(24, 50)
+    ax.set_aspect("equal", adjustable="box")
+
+    legend_handles = [
+        mpatches.Patch(color=color, label=label)
+        for _, label, color in DISTANCE_BANDS
+    ]
+
+    ax.legend(
+        handles=legend_handles,
+        title="Miles to nearest site",
+        loc="lower left",
+        fontsize="small"
+    )
+
+    ax.set_title("Distance to Nearest Warehouse by ZIP", fontsize=16)
+    ax.axis("off")
+    fig.tight_layout()
+
+    st.pyplot(fig)
+
+    # ---------------- Service areas ----------------
+    st.subheader("📍 Service Areas")
+
+    summary_df = (
+        pd.Series(nearest_miles)
+        .groupby(nearest_sites)
+        .agg(["count", "mean", "max"])
+        .round(1)
+        .rename(columns={
+            "count": "ZIPs Served",
+            "mean": "Avg Distance (miles)",
+            "max": "Max Distance (miles)"
+        })
+        .sort_values("ZIPs Served", ascending=False)
+    )
+
+    st.dataframe(summary_df)
+
+    # Serializing ~30k rows is only worth it when someone asks for the file
+    assignment_key = assignment_digest(index)
+    if st.button("Prepare Coverage CSV"):
+        st.session_state.coverage_csv_key = assignment_key
+
+    if st.session_state.get("coverage_csv_key") == assignment_key:
+        st.download_button(
+            label="📥 Download Coverage CSV",
+            data=coverage_csv(assignment_key, nearest_sites, nearest_miles),
+            file_name="warehouse_coverage.csv",
+            mime="text/csv"
+        )
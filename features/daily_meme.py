@@ -1,25 +1,88 @@
 import streamlit as st
+import hashlib
+import io
 import os
+from datetime import date
 from PIL import Image
 
 # ---------------- Resource path ----------------
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 
+DISPLAY_WIDTH = 600
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp"}
+
+# ---------------- Asset index (scanned once per process) ----------------
+@st.cache_resource
+def load_asset_index():
+    index = []
+    if not os.path.isdir(ASSETS_DIR):
+        return index
+
+    for name in sorted(os.listdir(ASSETS_DIR)):
+        path = os.path.join(ASSETS_DIR, name)
+        if os.path.splitext(name)[1].lower() not in IMAGE_EXTENSIONS:
+            continue
+        if not os.path.isfile(path):
+            continue
+
+        with open(path, "rb") as f:
+            content_hash = hashlib.sha256(f.read()).hexdigest()
+
+        index.append({"name": name, "path": path, "hash": content_hash})
+
+    return index
+
+# ---------------- Pre-sized variants (cached by content hash) ----------------
+@st.cache_resource
+def load_variant(content_hash, _path, width=DISPLAY_WIDTH):
+    # Keyed by content hash only (Streamlit skips underscore arguments)
+    image = Image.open(_path)
+    image.load()
+
+    # Convert first: Pillow resizes "P" and "1" images with nearest-neighbour
+    has_alpha = (
+        image.mode in ("RGBA", "LA", "PA")
+        or "transparency" in image.info
+    )
+    image = image.convert("RGBA" if has_alpha else "RGB")
+
+    if image.width > width:
+        height = round(image.height * width / image.width)
+        image = image.resize((width, height), Image.LANCZOS)
+
+    # PNG/JPEG bytes go to the browser as-is; st.image re-encodes anything else
+    buffer = io.BytesIO()
+    if has_alpha:
+        image.save(buffer, format="PNG", optimize=True)
+    else:
+        image.save(buffer, format="JPEG", quality=90, optimize=True)
+
+    return buffer.getvalue()
+
+@st.cache_resource
+def warm_variants():
+    for asset in load_asset_index():
+        load_variant(asset["hash"], asset["path"])
+
+def image_of_the_day(index, today=None):
+    today = today or date.today()
+    return index[today.toordinal() % len(index)]
+
+# ---------------- Streamlit Feature Entry Point ----------------
 def daily_meme_app():
     st.header("🖼️ Image Viewer")
 
-    image_name = "meme.png"  # change if needed
-    image_path = os.path.join(ASSETS_DIR, image_name)
-
-    if not os.path.exists(image_path):
-        st.error(f"Image not found: {image_name}")
+    index = load_asset_index()
+    if not index:
+        st.error(f"No images found in {os.path.basename(ASSETS_DIR)}/")
         return
 
-    image = Image.open(image_path)
+    warm_variants()
+    asset = image_of_the_day(index)
 
     st.image(
-        image,
-        caption=image_name,
-        width=600
+        load_variant(asset["hash"], asset["path"]),
+        caption=asset["name"],
+        width=DISPLAY_WIDTH
     )
@@ -0,0 +1,116 @@
+import numpy as np
+
+EARTH_RADIUS_MILES = 3958.8
+
+
+# ---------------- Vectorized distance (Haversine) ----------------
+def haversine_miles_matrix(lat, lon, site_lat, site_lon):
+    """Great-circle miles from every point to every site, shape (points, sites)."""
+    lat = np.radians(np.asarray(lat, dtype=float))[:, None]
+    lon = np.radians(np.asarray(lon, dtype=float))[:, None]
+    site_lat = np.radians(np.asarray(site_lat, dtype=float))[None, :]
+    site_lon = np.radians(np.asarray(site_lon, dtype=float))[None, :]
+
+    a = (
+        np.sin((site_lat - lat) / 2) ** 2
+        + np.cos(lat)
+        * np.cos(site_lat)
+        * np.sin((site_lon - lon) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+# ---------------- Incremental nearest-site assignment ----------------
+class CoverageIndex:
+    """
+    Nearest active site for a fixed set of points.
+
+    Every site is registered with its column of point distances. Adding a
+    site only touches the points it is closer to; removing one only
+    re-ranks the points it was serving, so what-if toggles never rerun
+    the full points x sites pass.
+    """
+
+    def __init__(self, n_points):
+        self.sites = []
+        self._columns = []
+        self._active = []
+        self.nearest = np.full(n_points, -1, dtype=int)
+        self.nearest_miles = np.full(n_points, np.inf)
+
+    @property
+    def active_sites(self):
+        return [s for s, on in zip(self.sites, self._active) if on]
+
+    def _site_index(self, site, miles=None):
+        if site in self.sites:
+            return self.sites.index(site)
+        if miles is None:
+            raise KeyError(f"Unknown site: {site}")
+        miles = np.asarray(miles, dtype=float)
+        if miles.shape != self.nearest_miles.shape:
+            raise ValueError(
+                f"Distance column for {site} must have {len(self.nearest)} rows"
+            )
+        self.sites.append(site)
+        self._columns.append(miles)
+        self._active.append(False)
+        return len(self.sites) - 1
+
+    def add_site(self, site, miles=None):
+        """Activate a site (registering it if new); returns changed point rows."""
+        idx = self._site_index(site, miles)
+        if self._active[idx]:
+            return np.empty(0, dtype=int)
+
+        self._active[idx] = True
+        column = self._columns[idx]
+        changed = np.flatnonzero(column < self.nearest_miles)
+        self.nearest[changed] = idx
+        self.nearest_miles[changed] = column[changed]
+        return changed
+
+    def remove_site(self, site):
+        """Deactivate a site; returns the point rows that were re-assigned."""
+        idx = self._site_index(site)
+        if not self._active[idx]:
+            return np.empty(0, dtype=int)
+
+        self._active[idx] = False
+        changed = np.flatnonzero(self.nearest == idx)
+
+        active = [i for i, on in enumerate(self._active) if on]
+        if not active:
+            self.nearest[changed] = -1
+            self.nearest_miles[changed] = np.inf
+            return changed
+
+        sub = np.column_stack([self._columns[i][changed] for i in active])
+        best = sub.argmin(axis=1)
+        self.nearest[changed] = np.asarray(active)[best]
+        self.nearest_miles[changed] = sub[np.arange(len(changed)), best]
+        return changed
+
+    def sync(self, active_sites, columns):
+        """
+        Make `active_sites` the active set, pulling new columns from the
+        `columns` mapping. Returns the point rows whose assignment changed.
+        """
+        wanted = set(active_sites)
+        changed = []
+
+        # Add first so removed sites' points are re-ranked against the new set
+        for site in active_sites:
+            changed.append(self.add_site(site, columns.get(site)))
+
+        for site in self.active_sites:
+            if site not in wanted:
+                changed.append(self.remove_site(site))
+
+        if not changed:
+            return np.empty(0, dtype=int)
+        return np.unique(np.concatenate(changed))
+
+    def nearest_site_names(self):
+        names = np.asarray(self.sites + [None], dtype=object)
+        return names[self.nearest]
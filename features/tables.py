@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+import os
+import threading
+
+from features.nearest import haversine_miles_matrix
+
+# Sentinel for origin/destination ZIP3 pairs with no zone in the rate file
+NO_ZONE = 127
+
+# ---------------- Resource path (repo-root safe) ----------------
+def resource_path(relative_path: str) -> str:
+    return os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        relative_path
+    )
+
+# ---------------- Raw readers (no Streamlit dependency) ----------------
+def read_warehouses():
+    df = pd.read_excel(resource_path("MaerskWarehouses.xlsx"))
+
+    # Normalize column names
+    df.columns = df.columns.str.strip().str.lower()
+
+    required_cols = {"warehouse", "lat", "long"}
+    if not required_cols.issubset(df.columns):
+        raise ValueError(
+            f"Warehouse file must contain columns: {required_cols}"
+        )
+
+    return df
+
+def read_zip_centroids():
+    df = pd.read_csv(resource_path("Centroids.csv"))
+
+    # Normalize column names
+    df.columns = df.columns.str.strip().str.lower()
+
+    required_cols = {"zip", "city", "state", "lat", "long"}
+    if not required_cols.issubset(df.columns):
+        raise ValueError(
+            f"ZIP centroid file must contain columns: {required_cols}"
+        )
+
+    df["zip"] = df["zip"].astype(str).str.zfill(5)
+    return df
+
+def read_zone_matrix():
+    """Dense origin ZIP3 x destination ZIP3 zone table (NO_ZONE if unrated)."""
+    df = pd.read_excel(resource_path("Maersk Zones.xlsx"))
+
+    origin = df["Set_ID"].astype(int).to_numpy()
+    dest_min = df["Min_Zip_Int"].astype(int).to_numpy()
+    dest_max = df["Max_Zip_Int"].astype(int).to_numpy()
+    zone = df["Zone"].astype(int).to_numpy()
+
+    # Expand every destination range without a Python-level loop
+    lengths = dest_max - dest_min + 1
+    starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    dest = np.repeat(dest_min, lengths) + np.arange(lengths.sum()) - starts
+
+    matrix = np.full((1000, 1000), NO_ZONE, dtype=np.int8)
+    np.minimum.at(
+        matrix,
+        (np.repeat(origin, lengths), dest),
+        np.repeat(zone, lengths).astype(np.int8)
+    )
+    return matrix
+
+# ---------------- ZIP normalization ----------------
+def to_zip3(zip_code):
+    zip_code = str(zip_code).strip()
+    if len(zip_code) <= 3:
+        return zip_code.zfill(3)
+    return zip_code.zfill(5)[:3]
+
+# ---------------- Precomputed lookup tables ----------------
+class LookupTables:
+    """
+    In-memory zone and nearest-warehouse tables for batch lookups.
+
+    Everything is computed once at construction; lookups are pure numpy
+    indexing, so one instance can be shared by any number of callers.
+    """
+
+    def __init__(self, zone_matrix, zip_centroids, warehouses):
+        # zone_matrix may also be a zero-argument loader, run on first use
+        self._zone_matrix = zone_matrix
+        self._zone_lock = threading.Lock()
+        if not callable(zone_matrix):
+            zone_matrix.setflags(write=False)
+
+        # Shared by every caller: treat the frames and arrays as read-only
+        self.zip_centroids = zip_centroids
+        self.warehouses = warehouses
+        self.zip_index = pd.Index(zip_centroids["zip"])
+        self.warehouse_names = warehouses["warehouse"].to_numpy(dtype=object)
+
+        # ZIP centroid x warehouse miles, column order = warehouse_names
+        self.distances = haversine_miles_matrix(
+            zip_centroids["lat"].to_numpy(),
+            zip_centroids["long"].to_numpy(),
+            warehouses["lat"].to_numpy(),
+            warehouses["long"].to_numpy()
+        )
+        self.ranked = np.argsort(self.distances, axis=1)
+        self.ranked_miles = np.take_along_axis(
+            self.distances, self.ranked, axis=1
+        )
+
+        for array in (self.distances, self.ranked, self.ranked_miles):
+            array.setflags(write=False)
+
+    @classmethod
+    def load(cls, lazy_zones=False):
+        # The rate file is by far the slowest input (seconds, vs. well under
+        # one for the rest); lazy_zones defers it until zones are asked for
+        zone_matrix = read_zone_matrix if lazy_zones else read_zone_matrix()
+        return cls(zone_matrix, read_zip_centroids(), read_warehouses())
+
+    @property
+    def zone_matrix(self):
+        if callable(self._zone_matrix):
+            with self._zone_lock:
+                if callable(self._zone_matrix):
+                    matrix = self._zone_matrix()
+                    matrix.setflags(write=False)
+                    self._zone_matrix = matrix
+        return self._zone_matrix
+
+    def zones(self, origins, destinations):
+        """
+        Best zone from any origin ZIP3 to each destination ZIP3.
+
+        Returns (zones, from_origin) where zones[j] is NO_ZONE when no
+        origin rates destination j, and from_origin[i, j] marks every
+        origin that achieves that zone.
+        """
+        o = np.asarray([int(z) for z in origins], dtype=int)
+        d = np.asarray([int(z) for z in destinations], dtype=int)
+
+        sub = self.zone_matrix[np.ix_(o, d)]
+        zones = sub.min(axis=0)
+        from_origin = (sub == zones) & (zones != NO_ZONE)
+        return zones, from_origin
+
+    def zone_frame(self, origins):
+        """
+        Best zone per rated destination ZIP3 for a set of origin ZIP3s, as
+        zip3 / Zone / OriginWithMinZone rows (the Zone Map CSV layout).
+        """
+        origins = sorted(set(origins))
+        zones, from_origin = self.zones(origins, range(1000))
+
+        rated = np.flatnonzero(zones != NO_ZONE)
+        origin_names = np.asarray(origins, dtype=object)
+
+        return pd.DataFrame({
+            "zip3": [f"{d:03d}" for d in rated],
+            "Zone": zones[rated].astype(int),
+            "OriginWithMinZone": [
+                ", ".join(origin_names[from_origin[:, d]]) for d in rated
+            ],
+        })
+
+    def nearest(self, zips, k):
+        """
+        k nearest warehouses for each 5-digit ZIP.
+
+        Returns (found, names, miles); rows of names/miles are only
+        meaningful where found is True.
+        """
+        k = max(1, min(k, len(self.warehouse_names)))
+        rows = self.zip_index.get_indexer(list(zips))
+        found = rows >= 0
+        rows = np.where(found, rows, 0)
+
+        names = self.warehouse_names[self.ranked[rows, :k]]
+        miles = self.ranked_miles[rows, :k]
+        return found, names, miles
@@ -1,11 +1,11 @@
 import streamlit as st
-import pandas as pd
 import geopandas as gpd
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import os
-from math import radians, sin, cos, sqrt, atan2
 from shapely.geometry import LineString
 
+from features.tables import LookupTables
+
 # ---------------- Resource path (repo-root safe) ----------------
 def resource_path(relative_path: str) -> str:
     return os.path.join(
@@ -14,36 +14,17 @@ def resource_path(relative_path: str) -> str:
         relative_path
     )
 
-# ---------------- Distance calculation (Haversine) ----------------
-def haversine_miles(lat1, lon1, lat2, lon2):
-    R = 3958.8  # Earth radius in miles
-
-    dlat = radians(lat2 - lat1)
-    dlon = radians(lon2 - lon1)
-
-    a = (
-        sin(dlat / 2) ** 2
-        + cos(radians(lat1))
-        * cos(radians(lat2))
-        * sin(dlon / 2) ** 2
-    )
-
-    c = 2 * atan2(sqrt(a), sqrt(1 - a))
-    return R * c
+# ---------------- Shared lookup tables ----------------
+@st.cache_resource
+def load_lookup_tables():
+    # One instance per process, shared by every tool and session; the zone
+    # table is only read the first time Zone Map needs it
+    return LookupTables.load(lazy_zones=True)
 
 # ---------------- Load warehouses ----------------
 @st.cache_data
 def load_warehouses():
-    df = pd.read_excel(resource_path("MaerskWarehouses.xlsx"))
-
-    # Normalize column names
-    df.columns = df.columns.str.strip().str.lower()
-
-    required_cols = {"warehouse", "lat", "long"}
-    if not required_cols.issubset(df.columns):
-        raise ValueError(
-            f"Warehouse file must contain columns: {required_cols}"
-        )
+    df = load_lookup_tables().warehouses.copy()
 
     gdf = gpd.GeoDataFrame(
         df,
@@ -53,40 +34,31 @@ def load_warehouses():
 
     return gdf
 
-# ---------------- Load ZIP centroids ----------------
-@st.cache_data
-def load_zip_centroids():
-    df = pd.read_csv(resource_path("Centroids.csv"))
-
-    # Normalize column names
-    df.columns = df.columns.str.strip().str.lower()
+# ---------------- ZIP picker labels ----------------
+@st.cache_resource
+def load_zip_labels():
+    zips = load_lookup_tables().zip_centroids
 
-    required_cols = {"zip", "city", "state", "lat", "long"}
-    if not required_cols.issubset(df.columns):
-        raise ValueError(
-            f"ZIP centroid file must contain columns: {required_cols}"
-        )
-
-    df["zip"] = df["zip"].astype(str).str.zfill(5)
-    return df
+    labels = (
+        zips["zip"]
+        + " – "
+        + zips["city"].str.title()
+        + ", "
+        + zips["state"].str.upper()
+    )
+    # Tuple so the shared cached value can't be mutated by a session
+    return tuple(labels.sort_values())
 
 # ---------------- Streamlit Feature Entry Point ----------------
 def warehouse_map_app():
     st.header("🏭 Warehouse Map")
 
-    zip_centroids = load_zip_centroids()
-
-    zip_centroids["zip_label"] = (
-        zip_centroids["zip"]
-        + " – "
-        + zip_centroids["city"].str.title()
-        + ", "
-        + zip_centroids["state"].str.upper()
-    )
+    tables = load_lookup_tables()
+    zip_centroids = tables.zip_centroids
 
     zip_label = st.selectbox(
         "Enter a ZIP code",
-        options=zip_centroids["zip_label"].sort_values().tolist(),
+        options=load_zip_labels(),
         index=None,
         placeholder="Start typing ZIP, city, or state..."
     )
@@ -110,13 +82,12 @@ def warehouse_map_app():
         if not zip_input.isdigit() or len(zip_input) != 5:
             st.warning("Please enter a valid 5-digit ZIP code.")
         else:
-            zip_row = zip_centroids[zip_centroids["zip"] == zip_input]
-
-            if zip_row.empty:
+            if zip_input not in tables.zip_index:
                 st.warning("ZIP code not found.")
             else:
-                zip_lat = zip_row.iloc[0]["lat"]
-                zip_lon = zip_row.iloc[0]["long"]
+                zip_row = zip_centroids.iloc[tables.zip_index.get_loc(zip_input)]
+                zip_lat = zip_row["lat"]
+                zip_lon = zip_row["long"]
 
                 zip_point = gpd.GeoDataFrame(
                     {"zip": [zip_input]},
@@ -124,16 +95,13 @@ def warehouse_map_app():
                     crs="EPSG:4326"
                 )
 
-                warehouses["distance_miles"] = warehouses.apply(
-                    lambda r: haversine_miles(
-                        zip_lat,
-                        zip_lon,
-                        r.geometry.y,
-                        r.geometry.x
-                    ),
-                    axis=1
+                _, names, miles = tables.nearest([zip_input], 2)
+                nearest = (
+                    warehouses.set_index("warehouse")
+                    .loc[names[0]]
+                    .reset_index()
+                    .assign(distance_miles=miles[0])
                 )
-                nearest = warehouses.nsmallest(2, "distance_miles")
                 
                 # Build distance lines (ZIP → warehouse)
                 lines = []
@@ -149,7 +117,8 @@ def warehouse_map_app():
                     crs="EPSG:4326"
                 )
     # ---------------- Plot ----------------
-    fig, ax = plt.subplots(figsize=(15, 10))
+    fig = Figure(figsize=(15, 10))
+    ax = fig.subplots()
 
     # State boundaries
     states = gpd.read_file(
@@ -201,7 +170,7 @@ def warehouse_map_app():
 
     ax.set_title("Warehouse Locations & Nearest Facilities", fontsize=16)
     ax.axis("off")
-    plt.tight_layout()
+    fig.tight_layout()
 
     st.pyplot(fig)
 
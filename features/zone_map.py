@@ -1,10 +1,11 @@
 import streamlit as st
 import geopandas as gpd
-import matplotlib.pyplot as plt
-import pandas as pd
+from matplotlib.figure import Figure
 import matplotlib.patches as mpatches
 import os
 
+from features.warehouse_map import load_lookup_tables
+
 # ---------------- Resource path (repo-root safe) ----------------
 def resource_path(relative_path: str) -> str:
     return os.path.join(
@@ -27,41 +28,13 @@ def load_zip3_shapes():
 def process_data(origin_list, customer_name):
     progress_text = st.empty()
 
-    # Step 1: Load Excel
-    progress_text.info("Loading Excel file...")
-    excel_path = resource_path("Maersk Zones.xlsx")
-    MasterZone_df = pd.read_excel(excel_path)
+    # Step 1: Zone table (parsed once per process, shared with the API)
+    progress_text.info("Loading zone table...")
+    tables = load_lookup_tables()
 
     # Step 2: Process Data
     progress_text.info("Processing zone data...")
-    MasterZone_df["OriginZip"] = MasterZone_df["Set_ID"].astype(str).str.zfill(3)
-    MasterZone_df["DestZipMin"] = MasterZone_df["Min_Zip_Int"].astype(int)
-    MasterZone_df["DestZipMax"] = MasterZone_df["Max_Zip_Int"].astype(int)
-    MasterZone_df["Zone"] = MasterZone_df["Zone"].astype(int)
-
-    filtered = MasterZone_df[
-        MasterZone_df["OriginZip"].isin(origin_list)
-    ].copy()
-
-    filtered["DestZipRange"] = filtered.apply(
-        lambda r: range(r.DestZipMin, r.DestZipMax + 1),
-        axis=1
-    )
-
-    expanded_df = filtered.explode("DestZipRange")
-    expanded_df["zip3"] = expanded_df["DestZipRange"].astype(str).str.zfill(3)
-    expanded_df = expanded_df[["zip3", "Zone", "OriginZip"]]
-
-    min_zones = expanded_df.groupby("zip3")["Zone"].min().reset_index()
-    min_zone_df = expanded_df.merge(min_zones, on=["zip3", "Zone"])
-
-    expanded_df = (
-        min_zone_df
-        .groupby(["zip3", "Zone"])["OriginZip"]
-        .agg(lambda x: ", ".join(sorted(set(x))))
-        .reset_index()
-        .rename(columns={"OriginZip": "OriginWithMinZone"})
-    )
+    expanded_df = tables.zone_frame(origin_list)
 
     # Step 3: Load ZIP3 shapes
     progress_text.info("Loading ZIP3 map shapes...")
@@ -78,7 +51,9 @@ def process_data(origin_list, customer_name):
         7: "#72C8E3", 8: "#A1D8EF", 9: "#B5E0F5"
     }
 
-    fig, ax = plt.subplots(figsize=(15, 10))
+    # Figure objects are per-session; pyplot's global state is not thread-safe
+    fig = Figure(figsize=(15, 10))
+    ax = fig.subplots()
 
     # State boundaries (lightweight, OK to reload)
     states = gpd.read_file(
@@ -116,7 +91,7 @@ def process_data(origin_list, customer_name):
 
     ax.set_title(f"Zone Map – {customer_name}", fontsize=16)
     ax.axis("off")
-    plt.tight_layout()
+    fig.tight_layout()
 
     progress_text.success("Done!")
 
@@ -136,7 +111,9 @@ def zone_map_app():
         origin_list = [
             o.strip().zfill(3)
             for o in origin_input.split(",")
-            if o.strip().isdigit() and len(o.strip()) <= 3
+            if o.strip().isascii()
+            and o.strip().isdigit()
+            and len(o.strip()) <= 3
         ]
 
         if not origin_list:
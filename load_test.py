@@ -0,0 +1,394 @@
+"""
+Concurrent-session load test for the Streamlit app.
+
+Runs N simulated sales-rep sessions against app.py with Streamlit's
+AppTest driver, walking each session through the Zone Map, Warehouse Map,
+Coverage Map and Prioritization Board tools, and reports latency percentiles,
+throughput and memory for every session count.
+
+Each session runs in its own spawned process. AppTest swaps
+process-global runtime state (Runtime._instance, st.secrets, the page
+cache) around every run, so several AppTest sessions cannot share one
+interpreter. The price is that every session has its own st.cache_*
+entries and its own GIL: a real `streamlit run` instance shares both, so
+treat throughput as an upper bound and the per-process RSS as including
+one full copy of the caches. "MB growth" is how much a session process
+grew between warm-up (caches filled) and the end of its run, which is
+the closer estimate of what one extra session costs a shared server.
+
+Each tool is timed twice: the rerun that switches to it (which is the
+full map render for the map tools) and the interaction that follows.
+
+Usage:
+    python load_test.py --sessions 1 2 4 8 --iterations 3
+"""
+import argparse
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(BASE_DIR, "app.py")
+ZIP3_SHAPES = os.path.join(BASE_DIR, "shapefiles", "zip3_simplified.gpkg")
+
+TOOLS = ["Zone Map", "Warehouse Map", "Coverage Map", "Prioritization Board"]
+PHASES = ["switch", "action"]
+
+# ---------------- Realistic session inputs ----------------
+ZONE_MAP_REQUESTS = [
+    ("070, 900", "Acme Retail"),
+    ("606", "Midwest Supply Co"),
+    ("303, 750, 981", "Coastal Goods"),
+    ("191, 853", "Liberty Outfitters"),
+]
+
+WAREHOUSE_ZIPS = ["10001", "60601", "90012", "30303", "75201", "98101"]
+
+
+# ---------------- Helpers ----------------
+def percentile(values, pct):
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    k = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[k]
+
+
+def current_rss_mb():
+    # Linux exposes the live RSS; elsewhere fall back to the peak so far
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    if resource is None:
+        return float("nan")
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes everywhere else
+    if sys.platform == "darwin":
+        return rss / (1024 * 1024)
+    return rss / 1024
+
+
+class RssSampler(threading.Thread):
+    """Polls the process RSS in the background and keeps the peak."""
+
+    def __init__(self, interval=0.05):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak_mb = current_rss_mb()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.peak_mb = max(self.peak_mb, current_rss_mb())
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self.peak_mb = max(self.peak_mb, current_rss_mb())
+        return self.peak_mb
+
+
+def isolate_board_file(workdir):
+    # Sessions must not write over the team's real board while we hammer it
+    import features.prioritization_board as board
+
+    data_file = os.path.join(workdir, "prioritization_board.json")
+    if os.path.exists(board.DATA_FILE):
+        shutil.copy(board.DATA_FILE, data_file)
+
+    board.DATA_DIR = workdir
+    board.DATA_FILE = data_file
+
+
+def available_tools():
+    if os.path.exists(ZIP3_SHAPES):
+        return TOOLS
+
+    print(
+        f"Skipping Zone Map: {os.path.relpath(ZIP3_SHAPES, BASE_DIR)} "
+        "is not in the tree, so every Zone Map run would fail.",
+        flush=True
+    )
+    return [t for t in TOOLS if t != "Zone Map"]
+
+
+# ---------------- Tool drivers ----------------
+def drive_zone_map(at, session_id, iteration):
+    origins, customer = ZONE_MAP_REQUESTS[
+        (session_id + iteration) % len(ZONE_MAP_REQUESTS)
+    ]
+    at.text_input[0].input(origins)
+    at.text_input[1].input(customer)
+    at.button[0].click()
+
+
+def drive_warehouse_map(at, session_id, iteration):
+    zip_code = WAREHOUSE_ZIPS[(session_id + iteration) % len(WAREHOUSE_ZIPS)]
+    selectbox = at.selectbox[0]
+    label = next(
+        (o for o in selectbox.options if o.startswith(zip_code)),
+        selectbox.options[0]
+    )
+    selectbox.select(label)
+
+
+def drive_coverage_map(at, session_id, iteration):
+    # What-if toggle: drop or restore one warehouse per pass
+    warehouses = at.multiselect[0]
+    site = warehouses.options[(session_id + iteration) % len(warehouses.options)]
+    if site in warehouses.value:
+        warehouses.unselect(site)
+    else:
+        warehouses.select(site)
+
+
+def drive_prioritization_board(at, session_id, iteration):
+    # Writes land in this session's temp copy (see isolate_board_file)
+    name = next(t for t in at.text_input if t.label == "Client name")
+    priority = next(
+        t for t in at.text_input if t.label == "Priority (number or C)"
+    )
+    name.input(f"Load Test Client {session_id}-{iteration}")
+    priority.input("1")
+    next(b for b in at.button if b.label == "Add").click()
+
+
+DRIVERS = {
+    "Zone Map": drive_zone_map,
+    "Warehouse Map": drive_warehouse_map,
+    "Coverage Map": drive_coverage_map,
+    "Prioritization Board": drive_prioritization_board,
+}
+
+
+# ---------------- Session worker (runs in its own process) ----------------
+def run_session(session_id, tools, iterations, timeout, barrier):
+    sys.path.insert(0, BASE_DIR)
+    os.chdir(BASE_DIR)
+
+    workdir = tempfile.mkdtemp(prefix=f"loadtest_{session_id}_")
+    try:
+        try:
+            from streamlit.testing.v1 import AppTest
+
+            isolate_board_file(workdir)
+            at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+            at.run()
+        except Exception:
+            # Release everyone waiting on the barrier instead of hanging them
+            barrier.abort()
+            raise
+
+        warm_mb = current_rss_mb()
+        sampler = RssSampler()
+        sampler.start()
+
+        barrier.wait()
+
+        latencies = []
+        errors = []
+
+        def timed_run(tool, phase, run):
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+
+            if at.exception:
+                errors.append(f"{tool} ({phase}): {at.exception[0].message}")
+                return False
+            latencies.append((tool, phase, elapsed))
+            return True
+
+        for iteration in range(iterations):
+            for tool in tools:
+                try:
+                    switched = timed_run(
+                        tool, "switch",
+                        lambda: at.sidebar.radio[0].set_value(tool).run()
+                    )
+                    if not switched:
+                        continue
+
+                    DRIVERS[tool](at, session_id, iteration)
+                    timed_run(tool, "action", at.run)
+                except Exception as e:
+                    errors.append(f"{tool}: {e}")
+
+        peak_mb = sampler.stop()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        "session": session_id,
+        "latencies": latencies,
+        "errors": errors,
+        "warm_rss_mb": warm_mb,
+        "peak_rss_mb": peak_mb,
+    }
+
+
+# ---------------- One load level ----------------
+def run_level(n_sessions, tools, iterations, timeout):
+    ctx = get_context("spawn")
+    # Warm-up is one initial script run per session
+    barrier_timeout = timeout + 60
+
+    with ctx.Manager() as manager:
+        barrier = manager.Barrier(n_sessions + 1, timeout=barrier_timeout)
+
+        with ProcessPoolExecutor(
+            max_workers=n_sessions, mp_context=ctx
+        ) as pool:
+            futures = [
+                pool.submit(run_session, i, tools, iterations, timeout, barrier)
+                for i in range(n_sessions)
+            ]
+
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                for e in [f.exception() for f in futures]:
+                    if e is not None and not isinstance(
+                        e, threading.BrokenBarrierError
+                    ):
+                        raise e
+                raise RuntimeError(
+                    "Sessions did not finish warming up within "
+                    f"{barrier_timeout:.0f}s"
+                )
+
+            # Wall clock starts once every session is warmed up
+            start = time.perf_counter()
+            results = [f.result() for f in futures]
+            wall = time.perf_counter() - start
+
+    records = [rec for r in results for rec in r["latencies"]]
+    latencies = [s for _, _, s in records]
+
+    def stats(values):
+        return {
+            "p50_s": percentile(values, 50),
+            "p95_s": percentile(values, 95),
+            "p99_s": percentile(values, 99),
+        }
+
+    return {
+        "sessions": n_sessions,
+        "runs": len(latencies),
+        "errors": [e for r in results for e in r["errors"]],
+        "wall_s": wall,
+        "throughput_rps": len(latencies) / wall if wall else float("nan"),
+        **stats(latencies),
+        "by_tool": {
+            tool: {
+                phase: stats([
+                    s for t, p, s in records if t == tool and p == phase
+                ])
+                for phase in PHASES
+            }
+            for tool in tools
+        },
+        "rss_per_session_mb": mean([r["peak_rss_mb"] for r in results]),
+        "rss_total_mb": sum(r["peak_rss_mb"] for r in results),
+        "growth_per_session_mb": mean(
+            [r["peak_rss_mb"] - r["warm_rss_mb"] for r in results]
+        ),
+    }
+
+
+def mean(values):
+    return sum(values) / len(values) if values else float("nan")
+
+
+# ---------------- Reporting ----------------
+def print_report(levels):
+    header = (
+        f"{'sessions':>8} {'runs':>6} {'err':>4} {'runs/s':>7} "
+        f"{'p50 s':>7} {'p95 s':>7} {'p99 s':>7} "
+        f"{'MB/sess':>8} {'MB total':>9} {'MB growth':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for lv in levels:
+        print(
+            f"{lv['sessions']:>8} {lv['runs']:>6} {len(lv['errors']):>4} "
+            f"{lv['throughput_rps']:>7.2f} "
+            f"{lv['p50_s']:>7.2f} {lv['p95_s']:>7.2f} {lv['p99_s']:>7.2f} "
+            f"{lv['rss_per_session_mb']:>8.0f} {lv['rss_total_mb']:>9.0f} "
+            f"{lv['growth_per_session_mb']:>10.1f}"
+        )
+    print(
+        "MB/sess and MB total count one copy of the st.cache_* data per "
+        "session process; a single server holds it once."
+    )
+
+    print()
+    print("Per-tool latency (p50 / p95 / p99 seconds)")
+    for lv in levels:
+        print(f"  {lv['sessions']} session(s)")
+        for tool, phases in lv["by_tool"].items():
+            for phase, stat in phases.items():
+                print(
+                    f"    {tool:<22} {phase:<7} {stat['p50_s']:>7.2f} "
+                    f"{stat['p95_s']:>7.2f} {stat['p99_s']:>7.2f}"
+                )
+
+    for lv in levels:
+        for err in lv["errors"][:5]:
+            print(f"[{lv['sessions']} sessions] error: {err}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Concurrent-session load test for app.py"
+    )
+    parser.add_argument(
+        "--sessions", type=int, nargs="+", default=[1, 2, 4, 8],
+        help="Session counts to test, one load level each"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=3,
+        help="Passes over every tool per session"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=120,
+        help="Seconds a single script run may take before it fails"
+    )
+    parser.add_argument(
+        "--output", help="Optional path to write the results as JSON"
+    )
+    args = parser.parse_args()
+
+    tools = available_tools()
+
+    levels = []
+    for n in sorted(args.sessions):
+        print(f"Running {n} concurrent session(s)...", flush=True)
+        levels.append(run_level(n, tools, args.iterations, args.timeout))
+
+    print()
+    print_report(levels)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(levels, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()